@@ -141,7 +141,7 @@ def _render_referral_summary() -> tuple[str, InlineKeyboardMarkup]:
     if top:
         lines.append("Топ-10 по активациям:")
         for stats in top:
-            u = repo.get_user(stats.user_id)
+            u = stats.user
             name = f"@{u.username}" if u and u.username else str(stats.user_id)
             lines.append(
                 f"• {name}: приглашено {stats.invited_count}, активировано {stats.activated_count}, бонусы {stats.bonuses_earned}"
@@ -152,7 +152,7 @@ def _render_referral_summary() -> tuple[str, InlineKeyboardMarkup]:
     if pending:
         lines.append("Ожидают активации:")
         for ref in pending[:10]:
-            invitee = repo.get_user(ref.invitee_id)
+            invitee = ref.invitee
             invitee_name = f"@{invitee.username}" if invitee and invitee.username else str(ref.invitee_id)
             lines.append(f"• #{ref.id} — {invitee_name} (от {ref.created_at:%Y-%m-%d %H:%M})")
             kb.add(InlineKeyboardButton(f"🔍 #{ref.id}", callback_data=f"admin_referral:{ref.id}"))
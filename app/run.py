@@ -43,12 +43,20 @@ def create_dispatcher() -> Dispatcher:
 
     audit_chat_id = os.getenv("LOG_TO_AUDIT_CHAT_ID")
     if audit_chat_id:
-        async def _send_audit(payload: dict) -> None:
-            text = build_audit_summary(payload)
-            try:
-                await bot.send_message(int(audit_chat_id), text)
-            except Exception as exc:  # pragma: no cover - audit is best effort
-                log_event("audit_delivery_failed", level="WARN", err=str(exc))
+        async def _send_audit(batch: list[dict]) -> None:
+            # одна пачка событий -> минимум сообщений (лимит Telegram 4096 символов)
+            chunks: list[str] = []
+            for payload in batch:
+                summary = build_audit_summary(payload)
+                if chunks and len(chunks[-1]) + len(summary) + 2 <= 4096:
+                    chunks[-1] += "\n\n" + summary
+                else:
+                    chunks.append(summary[:4096])
+            for text in chunks:
+                try:
+                    await bot.send_message(int(audit_chat_id), text)
+                except Exception as exc:  # pragma: no cover - audit is best effort
+                    log_event("audit_delivery_failed", level="WARN", err=str(exc))
 
         set_audit_sink(_send_audit)
 
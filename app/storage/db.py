@@ -33,6 +33,8 @@ def init_db() -> None:
         SearchQuery,
     )  # noqa: WPS347
     db.connect(reuse_if_open=True)
+    # safe=True -> CREATE TABLE/INDEX IF NOT EXISTS: новые индексы из Meta
+    # докатываются и на уже существующую базу.
     db.create_tables([
         User,
         Usage,
@@ -96,6 +96,12 @@ class Ledger(BaseModel):
     ts = DateTimeField(default=datetime.utcnow)
     balance_after = IntegerField(null=True)
 
+    class Meta:
+        # count_bonuses_since / count_total_bonuses: user + reason (+ ts)
+        indexes = (
+            (("user", "reason", "ts"), False),
+        )
+
 
 class ReferralBan(BaseModel):
     id = AutoField()
@@ -110,3 +116,10 @@ class SearchQuery(BaseModel):
     role = CharField()
     city = CharField()
     created_at = DateTimeField(default=datetime.utcnow, index=True)
+
+    class Meta:
+        # get_trending_roles / get_trending_cities: фильтр по дате + GROUP BY
+        indexes = (
+            (("created_at", "role"), False),
+            (("created_at", "city"), False),
+        )
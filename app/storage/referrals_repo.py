@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 import secrets
 import string
+import time
 from typing import Iterable, Optional
 
 from peewee import fn
@@ -20,6 +21,10 @@ from .models import (
 
 _TOKEN_ALPHABET = string.ascii_letters + string.digits
 
+# Список банов меняется редко — держим его в памяти процесса с коротким TTL.
+_BAN_CACHE_TTL = 60.0
+_BAN_CACHE: dict = {"ts": 0.0, "ids": frozenset()}
+
 
 def _generate_token(length: int = 10) -> str:
     while True:
@@ -177,8 +182,17 @@ def increment_promocode_usage(promo: PromoCode) -> None:
     PromoCode.update(uses=PromoCode.uses + 1).where(PromoCode.id == promo.id).execute()
 
 
+def invalidate_ban_cache() -> None:
+    """Сбросить кэш банов (вызывать после добавления/снятия бана)."""
+    _BAN_CACHE["ts"] = 0.0
+
+
 def is_banned(user_id: int) -> bool:
-    return ReferralBan.select().where(ReferralBan.user == user_id).exists()
+    now = time.monotonic()
+    if not _BAN_CACHE["ts"] or now - _BAN_CACHE["ts"] > _BAN_CACHE_TTL:
+        ids = frozenset(row[0] for row in ReferralBan.select(ReferralBan.user).tuples())
+        _BAN_CACHE.update(ts=now, ids=ids)
+    return user_id in _BAN_CACHE["ids"]
 
 
 def referral_summary() -> dict[str, int]:
@@ -200,8 +214,10 @@ def referral_summary() -> dict[str, int]:
 
 
 def referral_top(limit: int = 10) -> Iterable[ReferralStats]:
+    # User подтягиваем тем же запросом: админка выводит username для каждой строки
     return (
-        ReferralStats.select()
+        ReferralStats.select(ReferralStats, User)
+        .join(User)
         .order_by(ReferralStats.activated_count.desc(), ReferralStats.invited_count.desc())
         .limit(limit)
     )
@@ -211,13 +227,26 @@ def get_referral(referral_id: int) -> Optional[Referral]:
     return Referral.get_or_none(Referral.id == referral_id)
 
 
+def _referrals_with_users():
+    """Referral + inviter/invitee одним JOIN'ом, без N+1 при обращении к ref.inviter/ref.invitee."""
+    inviter = User.alias()
+    invitee = User.alias()
+    return (
+        Referral.select(Referral, inviter, invitee)
+        .join(inviter, on=(Referral.inviter == inviter.user_id), attr="inviter")
+        .switch(Referral)
+        .join(invitee, on=(Referral.invitee == invitee.user_id), attr="invitee")
+        .switch(Referral)
+    )
+
+
 def list_recent_referrals(limit: int = 20) -> Iterable[Referral]:
-    return Referral.select().order_by(Referral.created_at.desc()).limit(limit)
+    return _referrals_with_users().order_by(Referral.created_at.desc()).limit(limit)
 
 
 def list_pending_referrals(limit: int = 20) -> Iterable[Referral]:
     return (
-        Referral.select()
+        _referrals_with_users()
         .where(Referral.status == "pending")
         .order_by(Referral.created_at.asc())
         .limit(limit)
@@ -1,4 +1,6 @@
 from __future__ import annotations
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional, Tuple, List
 
@@ -14,10 +16,30 @@ def _month_key(dt: Optional[datetime] = None) -> str:
 
 
 # ---------- базовые операции с пользователем/лимитами ----------
-def ensure_user(user_id: int, username: Optional[str], full_name: Optional[str]) -> User:
+# LRU «недавно виденных» user_id: защитные ensure_user(uid, None, None) внутри
+# репозиториев не трогают БД, если пользователя уже создавали/обновляли только что.
+_SEEN_TTL = 30.0
+_SEEN_MAX = 10_000
+_seen: "OrderedDict[int, float]" = OrderedDict()
+
+
+def _mark_seen(user_id: int) -> None:
+    _seen[user_id] = time.monotonic()
+    _seen.move_to_end(user_id)
+    while len(_seen) > _SEEN_MAX:
+        _seen.popitem(last=False)
+
+
+def ensure_user(user_id: int, username: Optional[str], full_name: Optional[str]) -> Optional[User]:
     """
     Создаёт пользователя при первом обращении и/или обновляет метаданные.
+    Если метаданных нет и пользователь встречался за последние _SEEN_TTL секунд,
+    запрос в БД пропускается и возвращается None.
     """
+    if username is None and full_name is None:
+        seen_at = _seen.get(user_id)
+        if seen_at is not None and time.monotonic() - seen_at < _SEEN_TTL:
+            return None
     with db.atomic():
         user, created = User.get_or_create(
             user_id=user_id,
@@ -32,7 +54,11 @@ def ensure_user(user_id: int, username: Optional[str], full_name: Optional[str])
         updates["last_seen"] = datetime.utcnow()
         if updates:
             User.update(**updates).where(User.user_id == user_id).execute()
-        return user
+    # внутри внешней транзакции atomic() — лишь savepoint: при её откате строки не будет,
+    # а «виденный» id пропустил бы следующий ensure_user и упал бы на FK
+    if not db.in_transaction():
+        _mark_seen(user_id)
+    return user
 
 
 def get_user(user_id: int) -> Optional[User]:
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import os
-from typing import Iterable, Set
+import re
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Set
+
+_DIGITS = re.compile(r"\d+")
+
+
+@lru_cache(maxsize=8)
+def _parse_admin_ids(raw: str) -> FrozenSet[int]:
+    return frozenset(int(m) for m in _DIGITS.findall(raw))
 
 
 def _load_admins() -> Set[int]:
-    raw = os.getenv("ADMIN_USER_IDS", "")
-    cleaned = raw.replace(" ", "")
-    return {int(x) for x in cleaned.split(",") if x.isdigit()}
+    return set(_parse_admin_ids(os.getenv("ADMIN_USER_IDS", "")))
 
 
 _ADMINS = _load_admins()
@@ -6,15 +6,46 @@ from pathlib import Path
 
 # можно переопределить в .env: DB_PATH=data/bot.db
 DB_PATH = os.getenv("DB_PATH", "data/bot.db")
+# базы меньше этого порога бэкапим целиком в памяти, без временного файла
+INMEMORY_MAX_BYTES = int(os.getenv("BACKUP_INMEMORY_MAX_MB", "100")) * 1024 * 1024
+
+
+def _db_size() -> int:
+    try:
+        return os.path.getsize(DB_PATH)
+    except OSError:
+        return 0
+
+
+def _backup_in_memory(dst_zip: Path) -> Path:
+    src = sqlite3.connect(DB_PATH, check_same_thread=False)
+    mem = sqlite3.connect(":memory:")
+    try:
+        src.backup(mem)
+        buf = mem.serialize()
+    finally:
+        mem.close()
+        src.close()
+
+    with zipfile.ZipFile(dst_zip, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as z:
+        z.writestr("bot.db", buf)
+    return dst_zip
+
 
 def make_sqlite_backup(dst_zip: Path | str) -> Path:
     """
     Безопасный бэкап SQLite без остановки приложения:
     копируем БД через sqlite backup API -> упаковываем в ZIP.
+    Небольшие базы копируются в :memory: и сразу сжимаются (без записи
+    и повторного чтения временного файла), крупные — через tmp-файл.
     """
     dst_zip = Path(dst_zip)
     dst_zip.parent.mkdir(parents=True, exist_ok=True)
 
+    # Connection.serialize() есть только с Python 3.11
+    if hasattr(sqlite3.Connection, "serialize") and _db_size() <= INMEMORY_MAX_BYTES:
+        return _backup_in_memory(dst_zip)
+
     # временный файл для копии
     tmp_db = dst_zip.with_suffix(".tmp.db")
 
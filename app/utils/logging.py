@@ -15,21 +15,52 @@ from datetime import datetime, timezone
 from logging import Logger
 from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict
+from typing import Any, Awaitable, Callable, Dict, List
+
+try:  # orjson заметно быстрее на мелких dict'ах; без него — stdlib json
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
 EMAIL_RE = re.compile(r"(?P<user>[A-Z0-9._%+-]+)@(?P<domain>[A-Z0-9.-]+\.[A-Z]{2,})", re.I)
 PHONE_RE = re.compile(r"\+?\d[\d .\-()]{5,}\d")
+# email и телефон одним проходом, результат — как у EMAIL_RE.sub, затем PHONE_RE.sub.
+# Без \b: для Python кириллица, цифры и «_» — тоже символы слова, и email вплотную к ним
+# утекал бы в лог. Телефон не заканчивается внутри email: если его последняя ASCII-цифра
+# продолжается до «@domain», это начало адреса — иначе от «+7 (916) 123-45-67@mail.ru»
+# в логе остался бы «@mail.ru»
+_EMAIL_DOMAIN = r"@[A-Z0-9.-]+\.[A-Z]{2,}"
+_PII_RE = re.compile(
+    rf"(?P<email>[A-Z0-9._%+-]+{_EMAIL_DOMAIN})"
+    rf"|(?P<phone>\+?\d[\d .\-()]{{5,}}\d)(?!(?<=[0-9])[A-Z0-9._%+-]*{_EMAIL_DOMAIN})",
+    re.I,
+)
+
+# тот же Unicode-\d, что в телефонной ветке: «８９１６…» и «٠١٢…» тоже цифры
+_HAS_DIGIT = re.compile(r"\d").search
 
 MAX_PREVIEW = 300
 MAX_RAW_TEXT = 2048
 
+# текстовые поля payload'а, которые маскируются и обрезаются (каждое — один раз)
+_FIELD_LIMITS: Dict[str, int] = {
+    "user_message_raw": MAX_RAW_TEXT,
+    "user_message_preview": MAX_PREVIEW,
+    "bot_reply_preview": MAX_PREVIEW,
+}
+
+
+def _mask_match(m: re.Match[str]) -> str:
+    return "[masked_email]" if m.lastgroup == "email" else "[masked_phone]"
+
 
 def _mask_text(value: str | None) -> str | None:
     if not value:
         return value
-    masked = EMAIL_RE.sub("[masked_email]", value)
-    masked = PHONE_RE.sub("[masked_phone]", masked)
-    return masked
+    # большинство строк без «@» и цифр — маскировать там нечего, regex не запускаем
+    if "@" not in value and not _HAS_DIGIT(value):
+        return value
+    return _PII_RE.sub(_mask_match, value)
 
 
 def _truncate(value: str | None, *, limit: int) -> str | None:
@@ -40,11 +71,57 @@ def _truncate(value: str | None, *, limit: int) -> str | None:
     return value[: limit - 1] + "…"
 
 
-def _iso_ts() -> str:
-    return datetime.now(timezone.utc).isoformat()
+def _dumps(event: Dict[str, Any]) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # >64-bit int или экзотический тип — пусть разбирается stdlib
+    return json.dumps(event, ensure_ascii=False, separators=(",", ":"))
+
+
+# (миллисекунда, строка): в пределах одной мс переиспользуем отформатированное время.
+# Кортеж подменяется целиком, поэтому потоки не увидят «половину» обновления.
+_ts_cache: tuple[int, str] = (0, "")
 
 
-@dataclass
+def _iso_ts() -> str:
+    global _ts_cache
+    now = time.time()
+    tick = int(now * 1000)
+    cached_tick, cached = _ts_cache
+    if tick == cached_tick:
+        return cached
+    ts = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    _ts_cache = (tick, ts)
+    return ts
+
+
+# поля контекста, попадающие в payload события (порядок = порядок ключей в JSON)
+_PAYLOAD_KEYS = (
+    "user_id",
+    "chat_id",
+    "username",
+    "full_name",
+    "is_admin",
+    "update_type",
+    "user_message_raw",
+    "command",
+    "args",
+    "dialog_step",
+    "bot_reply_type",
+    "bot_reply_preview",
+    "document_meta",
+    "quota",
+    "credits_delta",
+    "payment",
+    "referral",
+    "ok",
+    "err",
+)
+
+
+@dataclass(slots=True)
 class OperationContext:
     correlation_id: str
     started_at: float = field(default_factory=time.perf_counter)
@@ -69,32 +146,7 @@ class OperationContext:
     err: str | None = None
 
     def to_payload(self) -> Dict[str, Any]:
-        payload: Dict[str, Any] = {}
-        for key in (
-            "user_id",
-            "chat_id",
-            "username",
-            "full_name",
-            "is_admin",
-            "update_type",
-            "user_message_raw",
-            "command",
-            "args",
-            "dialog_step",
-            "bot_reply_type",
-            "bot_reply_preview",
-            "document_meta",
-            "quota",
-            "credits_delta",
-            "payment",
-            "referral",
-            "ok",
-            "err",
-        ):
-            value = getattr(self, key)
-            if value is not None:
-                payload[key] = value
-        return payload
+        return {key: value for key in _PAYLOAD_KEYS if (value := getattr(self, key)) is not None}
 
     def duration_ms(self) -> int:
         return int((time.perf_counter() - self.started_at) * 1000)
@@ -103,7 +155,12 @@ class OperationContext:
 _context_var: ContextVar[OperationContext | None] = ContextVar("operation_context", default=None)
 _queue_listener: QueueListener | None = None
 _logger: Logger | None = None
-_audit_callback: Callable[[Dict[str, Any]], Awaitable[None]] | None = None
+_audit_callback: Callable[[List[Dict[str, Any]]], Awaitable[None]] | None = None
+_audit_queue: asyncio.Queue[Dict[str, Any]] | None = None
+_audit_worker: asyncio.Task | None = None
+
+AUDIT_QUEUE_MAX = 1000
+AUDIT_BATCH_MAX = 20
 
 
 class DailySizeRotatingFileHandler(TimedRotatingFileHandler):
@@ -118,19 +175,27 @@ class DailySizeRotatingFileHandler(TimedRotatingFileHandler):
             encoding="utf-8",
         )
         self.max_bytes = max_bytes
+        # Размер файла считаем сами по мере записи, а не форматируя запись повторно
+        try:
+            self._bytes_written = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._bytes_written = 0
+
+    def format(self, record: logging.LogRecord) -> str:
+        msg = super().format(record)
+        self._bytes_written += len(msg.encode(self.encoding or "utf-8")) + len(self.terminator)
+        return msg
 
     def shouldRollover(self, record):  # type: ignore[override]
         if super().shouldRollover(record):
             return 1
         if self.max_bytes <= 0:
             return 0
-        if self.stream is None:
-            self.stream = self._open()
-        msg = f"{self.format(record)}\n"
-        self.stream.seek(0, os.SEEK_END)
-        if self.stream.tell() + len(msg.encode(self.encoding or "utf-8")) >= self.max_bytes:
-            return 1
-        return 0
+        return 1 if self._bytes_written >= self.max_bytes else 0
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._bytes_written = 0
 
 
 class JsonFormatter(logging.Formatter):
@@ -142,7 +207,7 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             event.setdefault("err", self.formatException(record.exc_info))
             event.setdefault("ok", False)
-        return json.dumps(event, ensure_ascii=False, separators=(",", ":"))
+        return _dumps(event)
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -189,7 +254,8 @@ def setup_logging() -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
-    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    # SimpleQueue (C-реализация) дешевле для producer'ов, чем Queue с Condition
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
     queue_handler = QueueHandler(log_queue)
     root_logger.handlers = [queue_handler]
 
@@ -212,11 +278,44 @@ def setup_logging() -> None:
     _queue_listener.start()
 
 
-def set_audit_sink(callback: Callable[[Dict[str, Any]], Awaitable[None]] | None) -> None:
+def set_audit_sink(callback: Callable[[List[Dict[str, Any]]], Awaitable[None]] | None) -> None:
+    """Callback получает пачку payload'ов (до AUDIT_BATCH_MAX за раз)."""
     global _audit_callback
     _audit_callback = callback
 
 
+async def _audit_loop(q: asyncio.Queue[Dict[str, Any]]) -> None:
+    while True:
+        batch = [await q.get()]
+        while len(batch) < AUDIT_BATCH_MAX and not q.empty():
+            batch.append(q.get_nowait())
+        callback = _audit_callback
+        if callback is None:
+            continue
+        try:
+            await callback(batch)
+        except Exception as exc:  # pragma: no cover - audit is best effort
+            log_event("audit_delivery_failed", level="WARN", err=str(exc), batch_size=len(batch))
+
+
+def _enqueue_audit(payload: Dict[str, Any]) -> None:
+    global _audit_queue, _audit_worker
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if _audit_worker is None or _audit_worker.done() or _audit_worker.get_loop() is not loop:
+        _audit_queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAX)
+        _audit_worker = loop.create_task(_audit_loop(_audit_queue))
+    assert _audit_queue is not None
+    try:
+        _audit_queue.put_nowait(payload)
+    except asyncio.QueueFull:
+        _audit_queue.get_nowait()  # выкидываем самое старое событие
+        _audit_queue.put_nowait(payload)
+        log_event("audit_dropped", level="WARN", correlation_id=payload.get("correlation_id"))
+
+
 def get_operation_context(create: bool = False) -> OperationContext | None:
     ctx = _context_var.get()
     if ctx is None and create:
@@ -249,26 +348,26 @@ def update_context(**fields: Any) -> None:
 
 def _prepare_payload(event: str, level: str, extra: Dict[str, Any]) -> Dict[str, Any]:
     ctx = get_operation_context()
+    if ctx:
+        correlation_id = ctx.correlation_id
+    elif "correlation_id" in extra:
+        correlation_id = extra["correlation_id"]
+    else:
+        correlation_id = str(uuid.uuid4())
+    # один литерал вместо трёх шагов update(): без промежуточных ресайзов словаря
     payload: Dict[str, Any] = {
         "ts": _iso_ts(),
         "level": level,
         "event": event,
-        "correlation_id": ctx.correlation_id if ctx else extra.get("correlation_id", str(uuid.uuid4())),
+        "correlation_id": correlation_id,
+        **(ctx.to_payload() if ctx else {}),
+        **extra,
     }
 
-    if ctx:
-        payload.update(ctx.to_payload())
-
-    payload.update(extra)
-
-    for field in ("user_message_raw", "bot_reply_preview"):
-        if field in payload and isinstance(payload[field], str):
-            limit = MAX_RAW_TEXT if field == "user_message_raw" else MAX_PREVIEW
-            payload[field] = _truncate(_mask_text(payload[field]), limit=limit)
-
-    for field in ("user_message_preview", "bot_reply_preview"):
-        if field in payload and isinstance(payload[field], str):
-            payload[field] = _truncate(_mask_text(payload[field]), limit=MAX_PREVIEW)
+    for field, limit in _FIELD_LIMITS.items():
+        value = payload.get(field)
+        if isinstance(value, str):
+            payload[field] = _truncate(_mask_text(value), limit=limit)
 
     if "err" in payload and payload["err"]:
         payload["err"] = _truncate(_mask_text(str(payload["err"])), limit=MAX_RAW_TEXT)
@@ -281,9 +380,12 @@ def _prepare_payload(event: str, level: str, extra: Dict[str, Any]) -> Dict[str,
 
 def log_event(event: str, level: str = "INFO", message: str | None = None, **extra: Any) -> None:
     logger = _ensure_logger()
+    lvl = getattr(logging, level, logging.INFO)
+    if not logger.isEnabledFor(lvl):
+        return
     payload = _prepare_payload(event, level, extra)
     record_message = message or extra.get("message") or event
-    logger.log(getattr(logging, level, logging.INFO), record_message, extra={"event_data": payload})
+    logger.log(lvl, record_message, extra={"event_data": payload})
 
 
 def log_exception(event: str, err: Exception, message: str | None = None, **extra: Any) -> None:
@@ -312,15 +414,16 @@ def complete_operation(ok: bool, err: str | None = None, *, force: bool = False,
         return
     update_context(ok=ok, err=err)
     level = "INFO" if ok else "ERROR"
-    payload = _prepare_payload("response_sent", level, {"err": err, "ok": ok, **extra})
+    lvl = getattr(logging, level, logging.INFO)
     logger = _ensure_logger()
-    logger.log(getattr(logging, level, logging.INFO), "response_sent", extra={"event_data": payload})
+    enabled = logger.isEnabledFor(lvl)
+    if not enabled and not _audit_callback:
+        return
+    payload = _prepare_payload("response_sent", level, {"err": err, "ok": ok, **extra})
+    if enabled:
+        logger.log(lvl, "response_sent", extra={"event_data": payload})
     if _audit_callback:
-        try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(_audit_callback(payload))
-        except RuntimeError:
-            pass
+        _enqueue_audit(payload)
 
 
 def stop_logging() -> None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Dict
 
 _WHITESPACE_RE = re.compile(r"\s+")
@@ -23,6 +24,8 @@ _CITY_ALIASES: Dict[str, str] = {
     "удалённая работа": "Удалёнка",
     "remote": "Удалёнка",
 }
+# Ключи сравниваем через casefold(); ё/е разведены явными записями выше
+_CITY_ALIASES = {key.casefold(): city for key, city in _CITY_ALIASES.items()}
 
 
 def _clean(value: str | None) -> str:
@@ -35,26 +38,26 @@ def normalize_role(value: str | None) -> str:
     return _clean(value)
 
 
+@lru_cache(maxsize=4096)
 def normalize_city(value: str | None) -> str:
+    # города в запросах сильно повторяются — результат кэшируется
     cleaned = _clean(value)
     if not cleaned:
         return ""
 
-    lowered = cleaned.lower()
+    lowered = cleaned.casefold()
     if lowered.startswith("г."):
         cleaned = cleaned[2:].strip()
-        lowered = cleaned.lower()
+        lowered = cleaned.casefold()
 
     alias = _CITY_ALIASES.get(lowered)
     if alias:
         return alias
 
     # аккуратный регистр: первая буква — прописная, остальные как в title()
-    normalized = cleaned.title()
     if "-" in cleaned:
-        parts = [part.capitalize() for part in cleaned.split("-")]
-        normalized = "-".join(parts)
-    return normalized
+        return "-".join(part.capitalize() for part in cleaned.split("-"))
+    return cleaned.title()
 
 
 def normalize_for_dedup(value: str) -> str:
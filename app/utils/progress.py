@@ -6,6 +6,34 @@ from typing import Sequence
 from aiogram import Bot
 from aiogram.utils.exceptions import MessageCantBeEdited, MessageNotModified
 
+# Все активные прогресс-сообщения крутит одна общая задача, а не по задаче на сообщение.
+_SPIN_REGISTRY: "set[ProgressMessage]" = set()
+_spin_loop_task: asyncio.Task | None = None
+
+
+async def _spin_loop() -> None:
+    global _spin_loop_task
+    try:
+        while _SPIN_REGISTRY:
+            await asyncio.sleep(min(pm._interval for pm in _SPIN_REGISTRY))
+            active = [pm for pm in list(_SPIN_REGISTRY) if pm._active]
+            for pm in active:
+                pm._spinner_index = (pm._spinner_index + 1) % len(pm._SPINNER)
+            await asyncio.gather(*(pm._render_current() for pm in active), return_exceptions=True)
+    finally:
+        if _spin_loop_task is asyncio.current_task():
+            _spin_loop_task = None
+
+
+def _ensure_spin_loop() -> None:
+    global _spin_loop_task
+    if (
+        _spin_loop_task is None
+        or _spin_loop_task.done()
+        or _spin_loop_task.get_loop() is not asyncio.get_running_loop()
+    ):
+        _spin_loop_task = asyncio.create_task(_spin_loop())
+
 
 class ProgressMessage:
     """Utility to manage a single editable progress message with spinner."""
@@ -29,7 +57,6 @@ class ProgressMessage:
         self._spinner_index = 0
         self._active = True
         self._lock = asyncio.Lock()
-        self._spin_task: asyncio.Task | None = None
 
     @classmethod
     async def create(
@@ -43,7 +70,8 @@ class ProgressMessage:
         text = template.format(spinner=cls._SPINNER[0])
         message = await bot.send_message(chat_id, text)
         inst = cls(bot, chat_id, message.message_id, template, interval=interval)
-        inst._spin_task = asyncio.create_task(inst._spin())
+        _SPIN_REGISTRY.add(inst)
+        _ensure_spin_loop()
         return inst
 
     async def update_template(self, template: str) -> None:
@@ -63,17 +91,6 @@ class ProgressMessage:
             except Exception:  # pragma: no cover
                 pass
 
-    async def _spin(self) -> None:
-        try:
-            while self._active:
-                await asyncio.sleep(self._interval)
-                if not self._active:
-                    break
-                self._spinner_index = (self._spinner_index + 1) % len(self._SPINNER)
-                await self._render_current()
-        except asyncio.CancelledError:  # pragma: no cover
-            raise
-
     async def finish(self, text: str, *, delete_after: float | None = None) -> None:
         await self._stop()
         try:
@@ -98,12 +115,10 @@ class ProgressMessage:
         if not self._active:
             return
         self._active = False
-        if self._spin_task:
-            self._spin_task.cancel()
-            try:
-                await self._spin_task
-            except asyncio.CancelledError:
-                pass
+        _SPIN_REGISTRY.discard(self)
+        # дождаться правки спиннера, если общая задача как раз её отправляет
+        async with self._lock:
+            pass
 
     async def _delete_later(self, delay: float) -> None:
         await asyncio.sleep(delay)
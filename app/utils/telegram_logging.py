@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -19,19 +22,43 @@ def _resolve_document_path(document: Any) -> Path | None:
     return None
 
 
+_DIMENSION_LAST_ROW_RE = re.compile(r"(\d+)$")
+
+
+def _last_row(sheet) -> int:
+    # В read-only режиме размер берётся из <dimension ref="A1:N57"/> без обхода строк
+    try:
+        match = _DIMENSION_LAST_ROW_RE.search(sheet.calculate_dimension())
+    except ValueError:  # лист без dimension — придётся считать честно
+        match = None
+    if match:
+        return int(match.group(1))
+    return sheet.max_row or 0
+
+
 def _detect_rows(path: Path | None) -> int | None:
-    if not path or not path.exists():
+    if not path:
         return None
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    # ключ включает mtime/size: перезаписанный файл пересчитается
+    return _detect_rows_cached(str(path), st.st_mtime, st.st_size)
+
+
+@lru_cache(maxsize=256)
+def _detect_rows_cached(path_str: str, mtime: float, size: int) -> int | None:
     try:
         from openpyxl import load_workbook
     except Exception:  # pragma: no cover - optional dependency missing
         return None
     try:
-        wb = load_workbook(path, read_only=True)
-        sheet = wb.active
-        rows = max(0, (sheet.max_row or 0) - 1)
-        wb.close()
-        return rows
+        wb = load_workbook(path_str, read_only=True)
+        try:
+            return max(0, _last_row(wb.active) - 1)
+        finally:
+            wb.close()
     except Exception:  # pragma: no cover - tolerate parsing errors
         return None
 
@@ -66,7 +93,8 @@ class LoggedBot(Bot):
         meta = _document_meta(response)
         if "rows" not in meta:
             meta_path = _resolve_document_path(document)
-            rows = _detect_rows(meta_path)
+            # openpyxl синхронный — не блокируем event loop
+            rows = await asyncio.to_thread(_detect_rows, meta_path)
             if rows is not None:
                 meta["rows"] = rows
         log_event("file_sent", message=f"document sent {meta.get('filename', '')}", document_meta=meta)
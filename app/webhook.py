@@ -1,9 +1,19 @@
 from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from aiogram import Bot, Dispatcher, types
 
 from .config import settings
 
-app = FastAPI()
+try:  # orjson разбирает апдейты заметно быстрее stdlib json
+    import orjson
+    from fastapi.responses import ORJSONResponse as _ResponseClass
+except ImportError:  # pragma: no cover - optional dependency
+    import json as _json
+
+    orjson = None
+    _ResponseClass = JSONResponse
+
+app = FastAPI(default_response_class=_ResponseClass)
 _dp: Dispatcher | None = None
 _bot: Bot | None = None
 
@@ -18,8 +28,9 @@ def set_dispatcher(dp: Dispatcher):
 async def handle_update(request: Request):
     if _dp is None:
         return {"status": "dispatcher not ready"}
-    data = await request.json()
-    update = types.Update(**data)
+    raw = await request.body()
+    data = orjson.loads(raw) if orjson is not None else _json.loads(raw)
+    update = types.Update.to_object(data)
     await _dp.process_update(update)
     return {"status": "ok"}
 
@@ -0,0 +1,108 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("lxml")
+
+_PATH = Path(__file__).resolve().parents[1] / "vendor" / "parser_tdnm" / "parsers" / "fetch_vacancies.py"
+_spec = importlib.util.spec_from_file_location("fetch_vacancies", _PATH)
+fetch_vacancies = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fetch_vacancies)
+
+
+def test_responsibilities_html_splits_br_list():
+    html = "<p><strong>Обязанности:</strong></p><p>- готовить<br>- мыть</p><p>Условия:</p><p>ДМС</p>"
+
+    assert fetch_vacancies._extract_responsibilities_html(html) == "готовить; мыть"
+
+
+def test_responsibilities_html_br_inside_heading_block():
+    html = "<p><strong>Обязанности:</strong><br/>готовить блюда;<br/>следить за чистотой</p>"
+
+    assert (
+        fetch_vacancies._extract_responsibilities_html(html)
+        == "готовить блюда; следить за чистотой"
+    )
+
+
+def test_schedule_html_uses_response_charset(monkeypatch):
+    page = (
+        '<html><body><p data-qa="vacancy-view-employment-mode">'
+        "График: 2/2, смена 12 часов</p></body></html>"
+    )
+
+    class FakeResponse:
+        status_code = 200
+        encoding = "utf-8"  # из заголовка Content-Type, <meta charset> в странице нет
+        content = page.encode("utf-8")
+
+    monkeypatch.setattr(fetch_vacancies, "_HH_CACHE", None)
+    monkeypatch.setattr(fetch_vacancies._SESSION, "get", lambda *a, **kw: FakeResponse())
+
+    assert fetch_vacancies._extract_schedule_from_html("https://hh.ru/vacancy/1") == ("2/2", 12.0)
+
+
+def test_responsibilities_html_heading_and_body_in_one_block():
+    html = "<p>Обязанности: готовить, мыть посуду. Требования: опыт от 1 года. Условия: ДМС</p>"
+
+    assert fetch_vacancies._extract_responsibilities_html(html) == "готовить, мыть посуду."
+
+
+def test_responsibilities_html_stops_on_long_next_heading():
+    html = (
+        "<p>Обязанности:</p><ul><li>готовить</li></ul>"
+        "<p>Требования к кандидату:</p><ul><li>опыт</li></ul>"
+    )
+
+    assert fetch_vacancies._extract_responsibilities_html(html) == "готовить"
+
+
+def test_title_mask_with_exclusions_raises_no_warnings():
+    import warnings
+
+    import pandas as pd
+
+    titles = pd.Series(["Повар", "Кассир повар", "Шеф-повар", "Водитель"], index=[3, 5, 7, 9])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        mask = fetch_vacancies._title_mask(titles, "повар")
+
+    assert mask.tolist() == [True, False, True, False]
+    assert mask.index.tolist() == [3, 5, 7, 9]
+
+
+def test_to_df_keeps_integer_column_after_dropping_rows(tmp_path):
+    def row(employer, shift_len):
+        values = dict.fromkeys(fetch_vacancies.TEMPLATE_COLS)
+        values.update({"Должность": "Повар", "Работодатель": employer,
+                       "Длительность \nсмены": shift_len, "Ссылка": "https://a/1"})
+        return tuple(values.values())
+
+    cols = fetch_vacancies._new_cols()
+    fetch_vacancies._add_row(cols, row("Кафе", 12))
+    # дубль по ссылке с пустой длительностью смены — выбывает и не должен делать колонку float
+    fetch_vacancies._add_row(cols, row("Бар", None))
+
+    df = fetch_vacancies.to_df(cols)
+    out = tmp_path / "out.csv"
+    fetch_vacancies._write_csv(df, str(out))
+
+    lines = out.read_text(encoding="utf-8-sig").splitlines()
+    assert len(df) == 1
+    assert ",12," in lines[-1]
+    assert "12.0" not in lines[-1]
+
+
+def test_write_csv_bom_and_lf(tmp_path):
+    import pandas as pd
+
+    df = pd.DataFrame({"Должность": ["Повар", 'Су-шеф, "ночь"'], "В час": [350.0, None]})
+    out = tmp_path / "out.csv"
+    fetch_vacancies._write_csv(df, str(out))
+
+    assert out.read_bytes() == (
+        '\ufeffДолжность,В час\nПовар,350.0\n"Су-шеф, ""ночь""",\n'.encode("utf-8")
+    )